@@ -1,217 +1,593 @@
+import heapq
+import math
+import numbers
+import sys
 import threading
-import time
+from collections import deque
+
+
+def _valid_priority(priority):
+    # Keys are priority + aging round and get compared, so only real, non-NaN numbers work
+    return (isinstance(priority, numbers.Real) and not isinstance(priority, bool)
+            and not math.isnan(priority))
+
+
+class Job:
+    # Slotted record: smaller than a dict and attribute reads skip the key hash
+    __slots__ = ("user_id", "job_id", "priority", "submission_time", "being_printed", "expired_at",
+                 "interactive", "aging_start", "alive", "deadline")
+
+    def __init__(self, user_id, job_id, priority, submission_time, interactive=False):
+        # String ids repeat across jobs (same user, resubmitted job ids); share one copy
+        if type(user_id) is str:
+            user_id = sys.intern(user_id)
+        if type(job_id) is str:
+            job_id = sys.intern(job_id)
+        self.user_id = user_id
+        self.job_id = job_id
+        self.priority = priority
+        self.submission_time = submission_time
+        self.interactive = interactive
+        self.aging_start = 0  # manager's aging round when the job entered the queue
+        self.alive = False  # True while queued; entries of dead jobs are skipped lazily
+        self.deadline = None  # submission_time + expiry_time, fixed when the job enters the queue
+        self.being_printed = False
+        self.expired_at = None
+
+    def waiting_time(self, now):
+        # Derived rather than stored, so ticks don't have to touch every queued job
+        return now - self.submission_time
+
 
 class PrintQueueManager:
-    def __init__(self, capacity=10, aging_interval=5, expiry_time=20):
-        self.expired_jobs_log = None
+    _MASK_BITS = 64  # widest key spread tracked in the bucket bitmask
+
+    def __init__(self, capacity=10, aging_interval=5, expiry_time=20, lifo_threshold=100,
+                 history_capacity=1024, output=None, verbose=True):
+        # Ring buffer of the most recent expiries; total_expired_jobs keeps the lifetime count
+        self.expired_jobs_log = deque(maxlen=history_capacity)
+        self.total_expired_jobs = 0
         self.capacity = capacity
-        self.queue = [None] * capacity
-        self.front = 0
-        self.rear = 0
-        self.size = 0
-        self.queue = []  # initialize your queue here
+        # Bucket queue: key -> deque of jobs in submission order, where key is priority +
+        # aging round at enqueue. Aging lowers every queued job by the same amount, so a
+        # key never changes once pushed; the effective priority is derived on demand.
+        # Only a handful of keys are live at once, so the non-empty ones fit in a bitmask:
+        # bit i is set when bucket _key_base + i holds jobs, and bit 0 is always the lowest.
+        # Non-int keys or a spread wider than _MASK_BITS fall back to a min-heap of keys
+        # (_key_mask is None then) until the buckets drain
+        self.queue = {}
+        self._key_base = 0
+        self._key_mask = 0
+        self._bucket_keys = []
+        self._aging_rounds = 0
         self.lock = threading.Lock()
         self.current_time = 0
         self.aging_interval = aging_interval
-        self.expiry_time = expiry_time
+        self._expiry_time = expiry_time
+        # Past this many queued jobs, interactive jobs skip the buckets and are served newest first
+        self.lifo_threshold = lifo_threshold
+        self._express = deque()
+        # Jobs in push order. expiry_time is fixed and submission times are stamped under
+        # a lock the clock also takes, so deadlines only grow along this deque and expiry
+        # just pops from the left while the head is due
+        self._expiry_queue = deque()
+        # job_id -> queued or staged Job, for O(1) lookup and duplicate checks
+        self._by_id = {}
+        # Producers only touch the staging deque under the ingest lock; consumers move it
+        # into the buckets in bulk under self.lock, so submissions never wait on a tick
+        self._ingest_lock = threading.Lock()
+        self._pending = deque()
+        # Simulation output goes to this text stream (sys.stdout at write time when None);
+        # with verbose=False nothing is formatted or written at all
+        self.output = output
+        self.verbose = verbose
+        self._log_buffer = []  # output produced under the lock, written once per public call
+        # (time, text) of the last rendered status; mutators reset it to None
+        self._status_cache = None
+
+    @property
+    def expiry_time(self):
+        # Read-only: changing it at runtime would put new deadlines behind older ones
+        return self._expiry_time
 
     # Module 1: Core Queue Management
-    def enqueue_job(self, user_id, job_id, priority):
-        with self.lock:
-            if self.is_full():
-                print(f"Queue is full! Cannot add job {job_id} from user {user_id}")
-                return False
-
-            job = {
-                "user_id": user_id,
-                "job_id": job_id,
-                "priority": priority,
-                "submission_time": self.current_time,
-                "waiting_time": 0,
-                "being_printed": False
-            }
-
-            self.queue[self.rear] = job
-            self.rear = (self.rear + 1) % self.capacity
-            self.size += 1
-            print(f"Job {job_id} from user {user_id} added to queue (Priority: {priority})")
-            return True
+    def enqueue_job(self, user_id, job_id, priority, interactive=False):
+        # Producers never take self.lock: the job is staged and moved into the buckets
+        # by the next consumer call (tick, dequeue, status, ...)
+        if not _valid_priority(priority):
+            self._emit("Invalid priority %r for job %s from user %s", priority, job_id, user_id)
+            return False
+        job = Job(user_id, job_id, priority, None, interactive)
+        with self._ingest_lock:
+            # Stamped under the ingest lock, which tick() holds while advancing the clock
+            job.submission_time = self.current_time
+            full = self.is_full()
+            # Claim the id: both enqueue paths check and insert under the ingest lock
+            claimed = not full and self._by_id.setdefault(job_id, job) is job
+            if claimed:
+                self._pending.append(job)
+        # Write only after releasing the lock, so consumers never wait on a producer's I/O
+        if full:
+            self._emit("Queue is full! Cannot add job %s from user %s", job_id, user_id)
+            return False
+        if not claimed:
+            self._emit("Job %s is already queued", job_id)
+            return False
+        self._emit("Job %s from user %s added to queue (Priority: %s)", job_id, user_id, priority)
+        return True
+
+    def _enqueue_unlocked(self, job):
+        # Caller must hold self.lock
+        self._drain_pending_unlocked()
+        if not _valid_priority(job.priority):
+            self._log("Invalid priority %r for job %s from user %s", job.priority, job.job_id, job.user_id)
+            return False
+        # Same claim as enqueue_job, so a producer cannot take the id between check and insert
+        with self._ingest_lock:
+            full = self.is_full()
+            claimed = not full and self._by_id.setdefault(job.job_id, job) is job
+        if full:
+            self._log("Queue is full! Cannot add job %s from user %s", job.job_id, job.user_id)
+            return False
+        if not claimed:
+            self._log("Job %s is already queued", job.job_id)
+            return False
+
+        self._push_unlocked(job)
+        self._log("Job %s from user %s added to queue (Priority: %s)", job.job_id, job.user_id, job.priority)
+        return True
+
+    def _push_unlocked(self, job):
+        # Compute everything that can fail before touching any queue state
+        express = job.interactive and len(self._by_id) - 1 > self.lifo_threshold
+        key = None if express else job.priority + self._aging_rounds
+        deadline = job.submission_time + self.expiry_time
+        self._status_cache = None
+        job.aging_start = self._aging_rounds
+        job.alive = True
+        job.deadline = deadline
+        if express:
+            self._express.appendleft(job)  # overloaded: newest interactive job goes first
+        else:
+            bucket = self.queue.get(key)
+            if bucket is None:
+                self.queue[key] = bucket = deque()
+                self._mark_bucket_unlocked(key)
+            bucket.append(job)
+        self._expiry_queue.append(job)
+
+    def _mark_bucket_unlocked(self, key):
+        mask = self._key_mask
+        if mask is not None and type(key) is int:
+            if not mask:
+                self._key_base = key
+                self._key_mask = 1
+                return
+            if key < self._key_base:
+                # New lowest key: shift so it lands on bit 0
+                if mask.bit_length() + self._key_base - key <= self._MASK_BITS:
+                    self._key_mask = (mask << (self._key_base - key)) | 1
+                    self._key_base = key
+                    return
+            elif key - self._key_base < self._MASK_BITS:
+                self._key_mask = mask | (1 << (key - self._key_base))
+                return
+        if mask is not None:
+            # Switch to the key heap; self.queue already holds the new key
+            self._key_mask = None
+            self._bucket_keys = list(self.queue)
+            heapq.heapify(self._bucket_keys)
+        else:
+            heapq.heappush(self._bucket_keys, key)
+
+    def _lowest_key_unlocked(self):
+        return self._key_base if self._key_mask is not None else self._bucket_keys[0]
+
+    def _drop_lowest_bucket_unlocked(self):
+        if self._key_mask is None:
+            del self.queue[heapq.heappop(self._bucket_keys)]
+            if not self._bucket_keys:
+                self._key_mask = 0  # empty again: back to the bitmask
+            return
+        del self.queue[self._key_base]
+        mask = self._key_mask ^ 1
+        if mask:
+            # Lowest set bit gives the next non-empty bucket; rebase onto it
+            low = (mask & -mask).bit_length() - 1
+            mask >>= low
+            self._key_base += low
+        self._key_mask = mask
+
+    def _drain_pending_unlocked(self):
+        if not self._pending:
+            return
+        # Swap the staging deque out so producers are held only for the exchange
+        with self._ingest_lock:
+            pending = self._pending
+            self._pending = deque()
+        while pending:
+            job = pending.popleft()
+            # Staged jobs already hold their _by_id slot (claimed under the ingest lock, so
+            # capacity was checked exactly); skip any printed by id before reaching the buckets
+            if self._by_id.get(job.job_id) is not job:
+                continue
+            try:
+                self._push_unlocked(job)
+            except Exception:
+                # Free the failed job's slot and put the rest back ahead of newer submissions
+                job.alive = False
+                del self._by_id[job.job_id]
+                with self._ingest_lock:
+                    pending.extend(self._pending)
+                    self._pending = pending
+                raise
+
+    def _ordered_jobs_unlocked(self):
+        # Live jobs in the order dequeue would serve them: buckets by key, each already FIFO,
+        # except that jobs aged down to the floor of 1 form one class ordered by waiting time
+        jobs = [job for job in self._express if job.alive]
+        floor = self._aging_rounds + 1
+        keys = sorted(self.queue)
+        clamped = [job for key in keys if key <= floor for job in self.queue[key] if job.alive]
+        # Stable sort: equal submission times keep the lower key first, as dequeue does
+        clamped.sort(key=lambda job: job.submission_time)
+        jobs.extend(clamped)
+        for key in keys:
+            if key > floor:
+                jobs.extend(job for job in self.queue[key] if job.alive)
+        return jobs
+
+    def is_job_queued(self, job_id):
+        return job_id in self._by_id
 
     def dequeue_job(self):
         with self.lock:
-            if self.is_empty():
-                return None
-
-            best_job = None
-            best_index = -1
-
-            current_index = self.front
-            for _ in range(self.size):
-                job = self.queue[current_index]
-                if job is not None and not job["being_printed"]:
-                    if best_job is None or (job["priority"], job["waiting_time"]) < (best_job["priority"], best_job["waiting_time"]):
-                        best_job = job
-                        best_index = current_index
-                current_index = (current_index + 1) % self.capacity
-
-            if best_index != -1:
-                # Remove the job from queue
-                for _ in range((self.rear - best_index) % self.capacity):
-                    next_index = (best_index + 1) % self.capacity
-                    self.queue[best_index] = self.queue[next_index]
-                    best_index = next_index
-                self.rear = (self.rear - 1 + self.capacity) % self.capacity
-                self.queue[self.rear] = None
-                self.size -= 1
-                return best_job
+            job = self._dequeue_unlocked()
+            self._flush_log()
+            return job
 
+    def _dequeue_unlocked(self):
+        self._drain_pending_unlocked()
+        if self.is_empty():
             return None
 
+        while self._express:
+            job = self._express.popleft()
+            if job.alive:
+                return self._release_unlocked(job)
+
+        # Highest priority (lowest number) first, oldest submission breaks ties
+        while self.queue:
+            lowest = self._lowest_key_unlocked()
+            bucket = self.queue[lowest]
+            while bucket and not bucket[0].alive:
+                bucket.popleft()
+            if not bucket:
+                self._drop_lowest_bucket_unlocked()
+                continue
+            if lowest <= self._aging_rounds + 1:
+                # Clamped at priority 1: every bucket at the floor is one class
+                bucket = self._oldest_clamped_bucket_unlocked()
+            job = bucket.popleft()
+            if not self.queue[lowest]:
+                self._drop_lowest_bucket_unlocked()
+            return self._release_unlocked(job)
+        return None
+
+    def _oldest_clamped_bucket_unlocked(self):
+        # Buckets emptied here stay registered; dequeue drops them once they are the lowest
+        floor = self._aging_rounds + 1
+        best = best_rank = None
+        for key, bucket in self.queue.items():
+            if key > floor:
+                continue
+            while bucket and not bucket[0].alive:
+                bucket.popleft()
+            if bucket:
+                rank = (bucket[0].submission_time, key)
+                if best is None or rank < best_rank:
+                    best, best_rank = bucket, rank
+        return best
+
+    def _release_unlocked(self, job):
+        # Job leaves the queue: fix its priority at the aged value the caller sees
+        del self._by_id[job.job_id]
+        job.alive = False
+        job.priority = self._effective_priority(job)
+        self._status_cache = None
+        self._compact_queue_unlocked()
+        return job
+
     def show_status(self):
         with self.lock:
-            print("\nCurrent Queue Status:")
-            print("====================")
-            index = self.front
-            for _ in range(self.size):
-                job = self.queue[index]
-                if job:
-                    print(f"JobID: {job['job_id']}, UserID: {job['user_id']}, Priority: {job['priority']}, Waiting: {job['waiting_time']}s")
-                index = (index + 1) % self.capacity
-            print("====================\n")
+            self._show_status_unlocked()
+            self._flush_log()
+
+    def _show_status_unlocked(self):
+        self._drain_pending_unlocked()
+        # Rendering every job is the costliest output; skip it when nobody is listening
+        if not self.verbose:
+            return
+        now = self.current_time
+        # Waiting times move with the clock, so the cache is only good for the time it was built at
+        if self._status_cache is None or self._status_cache[0] != now:
+            lines = ["\nCurrent Queue Status:", "===================="]
+            for job in self._ordered_jobs_unlocked():
+                lines.append(f"JobID: {job.job_id}, UserID: {job.user_id}, Priority: {self._effective_priority(job)}, Waiting: {job.waiting_time(now)}s")
+            lines.append("====================\n")
+            self._status_cache = (now, "\n".join(lines))
+        self._log(self._status_cache[1])
 
     def is_empty(self):
-        return self.size == 0
+        return len(self._by_id) == 0
 
     def is_full(self):
-        return self.size == self.capacity
+        return len(self._by_id) >= self.capacity
 
     # Module 2: Priority & Aging System
     def apply_priority_aging(self):
-        self.time_since_last_aging += 1
-        
-        if self.time_since_last_aging >= self.aging_interval:
-            for job in self.queue:
-                if not job['being_printed']:
-                    job['priority'] = max(1, job['priority'] - 1)  
-                    
-            self.time_since_last_aging = 0
-            
-        self.queue.sort(key=lambda x: (x['priority'], x['waiting_time']))
-    
-    def _sort_queue_by_priority(self):
-        self.queue.sort(key=lambda x: (x['priority'], x['waiting_time']))  # Implement aging logic and reorder queue
+        with self.lock:
+            self._apply_priority_aging_unlocked()
+
+    def _apply_priority_aging_unlocked(self):
+        # Called once per aging interval by tick(); bumps every waiting job one level.
+        # Bucket order is unaffected, so this is O(1) instead of a rebuild
+        self._aging_rounds += 1
+        self._status_cache = None
+
+    def _effective_priority(self, job):
+        return max(1, job.priority - (self._aging_rounds - job.aging_start))
+
+    def _compact_queue_unlocked(self):
+        # Rebuild once dead entries outnumber live ones, so the cost stays amortised O(1)
+        if len(self._expiry_queue) > 2 * len(self._by_id):
+            # Released jobs otherwise linger here until their deadline; filtering keeps the order
+            self._expiry_queue = deque(job for job in self._expiry_queue if job.alive)
+        entries = sum(map(len, self.queue.values())) + len(self._express)
+        if entries > 2 * len(self._by_id):
+            buckets = {}
+            for key, bucket in self.queue.items():
+                live = deque(job for job in bucket if job.alive)
+                if live:
+                    buckets[key] = live
+            self.queue = {}
+            self._key_mask = 0
+            self._bucket_keys = []
+            for key, bucket in buckets.items():
+                self.queue[key] = bucket
+                self._mark_bucket_unlocked(key)
+            self._express = deque(job for job in self._express if job.alive)
     
     # Module 3: Job Expiry & Cleanup
 
     def remove_expired_jobs(self):
+        # Unlocked peek at the expiry queue head: when several threads ask for a sweep, the
+        # first one does it and the rest find nothing due and return without the lock
+        if not self._pending and not self._expiry_due(self.current_time):
+            return 0
         with self.lock:
-            expired_jobs = []
-            remaining_jobs = []
-
-            for job in self.queue:
-                if job['waiting_time'] >= self.expiry_time and not job['being_printed']:
-                    expired_jobs.append(job)
-                    # Log the expired job for reporting
-                    self.expired_jobs_log.append({
-                        'job_id': job['job_id'],
-                        'user_id': job['user_id'],
-                        'expired_at_time': self.current_time,
-                        'total_wait_time': job['waiting_time']
-                    })
-                else:
-                    remaining_jobs.append(job)
-
-            # Update the queue with remaining jobs
-            self.queue = remaining_jobs
-
+            expired_count = self._remove_expired_unlocked(self.current_time)
+            self._flush_log()
+            return expired_count
+
+    def _remove_expired_unlocked(self, now):
+        self._drain_pending_unlocked()
+        expired_jobs = []
+        # Bind the hot names once; this loop runs for every due entry
+        expiry_queue = self._expiry_queue
+        by_id = self._by_id
+        log_expired = self.expired_jobs_log.append
+
+        # Deadlines grow in submission order, so only the head can be due
+        while expiry_queue and expiry_queue[0].deadline <= now:
+            job = expiry_queue.popleft()
+            if not job.alive or job.being_printed:
+                continue
+            job.alive = False
+            del by_id[job.job_id]
+            expired_jobs.append(job)
+            # Log the expired job for reporting; it has left the queue, so log it as is
+            job.expired_at = now
+            log_expired(job)
+
+        if expired_jobs:
+            self.total_expired_jobs += len(expired_jobs)
+            self._status_cache = None
+            # Expired entries stay in their buckets until popped or compacted
+            self._compact_queue_unlocked()
             # Notify about expired jobs
-            if expired_jobs:
-                self._notify_expired_jobs(expired_jobs)
+            self._notify_expired_jobs(expired_jobs, now)
 
-            return len(expired_jobs)  # Return count of expired jobs
+        return len(expired_jobs)  # Return count of expired jobs
 
-    def _notify_expired_jobs(self, expired_jobs):
-        print(f"\n EXPIRED JOBS ALERT - Time {self.current_time} ")
+    def time_until_next_expiry(self):
+        with self.lock:
+            self._drain_pending_unlocked()
+            expiry_queue = self._expiry_queue
+            while expiry_queue and not expiry_queue[0].alive:
+                expiry_queue.popleft()
+            if not expiry_queue:
+                return None
+            return max(0, expiry_queue[0].deadline - self.current_time)
+
+    def get_jobs_near_expiry(self, threshold_percent=0.8):
+        with self.lock:
+            self._drain_pending_unlocked()
+            # waiting >= threshold * expiry_time  <=>  deadline <= now + (1 - threshold) * expiry_time
+            cutoff = self.current_time + (1 - threshold_percent) * self.expiry_time
+            near = []
+            # Deadline order: stop at the first entry past the cutoff
+            for job in self._expiry_queue:
+                if job.deadline > cutoff:
+                    break
+                if job.alive and not job.being_printed:
+                    near.append(job)
+            return near
+
+    def _notify_expired_jobs(self, expired_jobs, now):
+        # One aggregated alert per sweep rather than a print per job, and none at all
+        # (no per-job formatting) when output is off
+        if not self.verbose:
+            return
+        lines = [f"\n EXPIRED JOBS ALERT - Time {now} "]
         for job in expired_jobs:
-            print(f"   Job {job['job_id']} from User {job['user_id']} has expired!")
-            print(f"   (Waited {job['waiting_time']}s, limit: {self.expiry_time}s)")
-        print("=" * 50)
+            lines.append(f"   Job {job.job_id} from User {job.user_id} has expired!")
+            lines.append(f"   (Waited {job.waiting_time(now)}s, limit: {self.expiry_time}s)")
+        lines.append("=" * 50)
+        self._log("\n".join(lines))
+
+    def _log(self, message, *args):
+        # %-style args: nothing is formatted when output is off
+        if self.verbose:
+            self._log_buffer.append(message % args if args else message)
+
+    def _flush_log(self):
+        # Everything one public call produced goes out in a single write
+        if self._log_buffer:
+            self._write("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _emit(self, message, *args):
+        # Unbuffered output for callers outside self.lock (the producer path)
+        if self.verbose:
+            self._write(message % args if args else message)
+
+    def _write(self, text):
+        output = sys.stdout if self.output is None else self.output
+        output.write(text + "\n")
+
+    def _expiry_due(self, now):
+        # Also used as an unlocked peek, so read the head once: a sweep on another
+        # thread may pop the last entry between an emptiness test and the index
+        try:
+            head = self._expiry_queue[0]
+        except IndexError:
+            return False
+        return head.deadline <= now
 
     def get_expired_jobs_report(self):
+        # Copy under the lock (a sweep may append mid-iteration), format outside it
+        with self.lock:
+            expired_jobs = list(self.expired_jobs_log)
+            total = self.total_expired_jobs
 
-        if not self.expired_jobs_log:
+        if not expired_jobs:
             return "No jobs have expired yet."
 
-        report = f"\n EXPIRED JOBS REPORT (Total: {len(self.expired_jobs_log)}) \n"
-        report += "=" * 60 + "\n"
-
-        for i, expired_job in enumerate(self.expired_jobs_log, 1):
-            report += f"{i:2d}. Job {expired_job['job_id']} (User {expired_job['user_id']})\n"
-            report += f"    Expired at: Time {expired_job['expired_at_time']}\n"
-            report += f"    Total wait: {expired_job['total_wait_time']}s\n"
-            report += "-" * 50 + "\n"
+        # Collect the fragments and join once; += would copy the whole report each line
+        parts = [f"\n EXPIRED JOBS REPORT (Total: {total}) \n"]
+        if total > len(expired_jobs):
+            parts.append(f" (showing the last {len(expired_jobs)})\n")
+        parts.append("=" * 60 + "\n")
 
-        return report
+        # Number entries by their lifetime position so they stay stable as old ones drop off
+        first = total - len(expired_jobs) + 1
+        separator = "-" * 50 + "\n"
+        for i, expired_job in enumerate(expired_jobs, first):
+            parts.append(f"{i:2d}. Job {expired_job.job_id} (User {expired_job.user_id})\n"
+                         f"    Expired at: Time {expired_job.expired_at}\n"
+                         f"    Total wait: {expired_job.waiting_time(expired_job.expired_at)}s\n")
+            parts.append(separator)
 
-    def update_waiting_times(self):
-        with self.lock:
-            for job in self.queue:
-                if not job['being_printed']:
-                    job['waiting_time'] = self.current_time - job['submission_time']
+        return "".join(parts)
 
     def cleanup_system(self):
-        # Update waiting times first
-        self.update_waiting_times()
-
-        # Remove expired jobs
-        expired_count = self.remove_expired_jobs()
-
-        return expired_count
+        with self.lock:
+            # Remove expired jobs
+            expired_count = self._remove_expired_unlocked(self.current_time)
+            self._flush_log()
+            return expired_count
 
 
     # Module 4: Concurrent Job Submission Handling
     def handle_simultaneous_submissions(self, jobs):
-        threads = []
-        for job in jobs:
-            t = threading.Thread(target=self.enqueue_job, args=(job["user_id"], job["job_id"], job["priority"]))
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join()
+        # Build the Job objects before taking the lock, then commit the whole batch
+        # under one acquisition instead of a thread per job
+        prepared = [Job(job["user_id"], job["job_id"], job["priority"], None, job.get("interactive", False))
+                    for job in jobs]
+        accepted = 0
+        with self.lock:
+            # The clock only moves under self.lock, so stamp here to keep push order
+            now = self.current_time
+            for job in prepared:
+                job.submission_time = now
+                if self._enqueue_unlocked(job):
+                    accepted += 1
+            self._flush_log()
+        return accepted
 
     # Module 5: Event Simulation & Time Management
     def tick(self):
+        # One critical section for the whole tick; helpers below assume the lock is held
         with self.lock:
+            self._drain_pending_unlocked()
+            # Read the clock once; every stage of this tick sees the same time
+            now = self._advance_time_unlocked()
+
+            if now % self.aging_interval == 0:
+                self._apply_priority_aging_unlocked()
+
+            # Skip the sweep entirely until the earliest deadline has passed
+            if self._expiry_due(now):
+                self._remove_expired_unlocked(now)
+            self._show_status_unlocked()
+            # Everything this tick produced goes out in a single write
+            self._flush_log()
+
+    def _advance_time_unlocked(self):
+        # Producers stamp submission times under the ingest lock; taking it here means a
+        # job staged before the clock moves never carries a later time than one after it
+        with self._ingest_lock:
             self.current_time += 1
-            print(f"\n[Tick {self.current_time}] Time has progressed.")
-
-            for job in self.queue:
-                job['waiting_time'] += 1
-
-            if self.current_time % self.aging_interval == 0:
-                self.apply_priority_aging()
-
-            self.remove_expired_jobs()
-            self.show_status()
+            now = self.current_time
+        self._log("\n[Tick %s] Time has progressed.", now)
+        return now
 
     # Module 6: Visualization & Reporting
     def print_queue_snapshot(self):
-        print(f"\n[Snapshot at time {self.current_time}]")
-        for i, job in enumerate(self.queue):
-            print(f"{i+1}. User: {job['user_id']}, Job: {job['job_id']}, Priority: {job['priority']}, Waiting: {job['waiting_time']}")
+        # Under the lock like show_status: staged jobs must be drained to show up, and the
+        # bucket deques can't be walked while another thread mutates them
+        with self.lock:
+            self._drain_pending_unlocked()
+            if self.verbose:
+                now = self.current_time
+                lines = [f"\n[Snapshot at time {now}]"]
+                for i, job in enumerate(self._ordered_jobs_unlocked()):
+                    lines.append(f"{i+1}. User: {job.user_id}, Job: {job.job_id}, Priority: {self._effective_priority(job)}, Waiting: {job.waiting_time(now)}")
+                self._log("\n".join(lines))
+            # Same output path as every other call, so it stays in order with them
+            self._flush_log()
 
     # Printing jobs
-    def print_jobs(self):
+    def print_job(self, job_id=None):
         with self.lock:
-            if self.is_empty():
-                print("No jobs to print - queue is empty")
-                return False
-
-            job = self.dequeue_job()
-            if job:
-                print(f"PRINTING: Job {job['job_id']} from user {job['user_id']} (Priority: {job['priority']}, Waited: {job['waiting_time']}s)")
-                return True
-            else:
-                print("No printable job found")
-                return False
+            printed = self._print_job_unlocked(job_id)
+            self._flush_log()
+            return printed
+
+    def _print_job_unlocked(self, job_id):
+        self._drain_pending_unlocked()
+        if self.is_empty():
+            self._log("No jobs to print - queue is empty")
+            return False
+
+        if job_id is None:
+            job = self._dequeue_unlocked()
+        else:
+            # O(1) lookup; the job's bucket entry is skipped when it reaches the front
+            job = self._by_id.get(job_id)
+            if job is not None and not job.alive:
+                # Staged by a producer after the drain above; bring it into the buckets first
+                self._drain_pending_unlocked()
+            if job is not None:
+                self._release_unlocked(job)
+        if job:
+            self._log("PRINTING: Job %s from user %s (Priority: %s, Waited: %ss)",
+                      job.job_id, job.user_id, job.priority, job.waiting_time(self.current_time))
+            return True
+        elif job_id is not None:
+            self._log("Job %s is not in the queue", job_id)
+            return False
+        else:
+            self._log("No printable job found")
+            return False
@@ -0,0 +1,243 @@
+import contextlib
+import io
+import unittest
+
+from print_manager import PrintQueueManager
+
+
+def make_manager(**kwargs):
+    # Output goes to a private buffer, so tests never depend on sys.stdout or logging setup
+    return PrintQueueManager(output=io.StringIO(), **kwargs)
+
+
+def submit(manager, *jobs):
+    # jobs: (job_id, priority) or (job_id, priority, interactive); one batch, one lock hold
+    batch = [{"user_id": 1, "job_id": job[0], "priority": job[1], "interactive": job[2] if len(job) > 2 else False}
+             for job in jobs]
+    return manager.handle_simultaneous_submissions(batch)
+
+
+def drain(manager):
+    order = []
+    while True:
+        job = manager.dequeue_job()
+        if job is None:
+            return order
+        order.append(job.job_id)
+
+
+class DispatchOrderTest(unittest.TestCase):
+    def test_lowest_priority_number_first_then_fifo(self):
+        manager = make_manager()
+        submit(manager, ("a", 3), ("b", 1), ("c", 2), ("d", 1))
+        self.assertEqual(drain(manager), ["b", "d", "c", "a"])
+
+    def test_aged_job_ties_with_newer_job_and_keeps_its_place(self):
+        manager = make_manager(aging_interval=1)
+        submit(manager, ("old", 3))
+        manager.tick()
+        manager.tick()
+        submit(manager, ("new", 1))
+        self.assertEqual(drain(manager), ["old", "new"])
+
+    def test_aging_clamps_at_one(self):
+        manager = make_manager(aging_interval=1, expiry_time=100)
+        submit(manager, ("a", 2))
+        for _ in range(5):
+            manager.tick()
+        self.assertEqual(manager.dequeue_job().priority, 1)
+
+    def test_jobs_at_the_priority_floor_go_by_waiting_time(self):
+        manager = make_manager(aging_interval=1, expiry_time=100)
+        submit(manager, ("old", 5))
+        for _ in range(3):
+            manager.tick()
+        submit(manager, ("new", 1))
+        for _ in range(3):
+            manager.tick()
+        manager.show_status()
+        status = manager.output.getvalue().rsplit("Current Queue Status:", 1)[1]
+        self.assertLess(status.index("JobID: old, UserID: 1, Priority: 1, Waiting: 6s"),
+                        status.index("JobID: new, UserID: 1, Priority: 1, Waiting: 3s"))
+        self.assertEqual(drain(manager), ["old", "new"])
+
+    def test_float_and_widely_spread_priorities(self):
+        manager = make_manager()
+        submit(manager, ("a", 2.5), ("b", 1.5), ("c", 10 ** 8), ("d", 1))
+        self.assertEqual(drain(manager), ["d", "b", "a", "c"])
+        self.assertTrue(manager.is_empty())
+
+
+class PrintJobTest(unittest.TestCase):
+    def test_print_by_id_then_dequeue_skips_printed_job(self):
+        manager = make_manager()
+        submit(manager, ("a", 1), ("b", 2), ("c", 3))
+        self.assertTrue(manager.print_job("a"))
+        self.assertFalse(manager.is_job_queued("a"))
+        self.assertEqual(drain(manager), ["b", "c"])
+
+    def test_print_unknown_id(self):
+        manager = make_manager()
+        submit(manager, ("a", 1))
+        self.assertFalse(manager.print_job("zz"))
+        self.assertTrue(manager.is_job_queued("a"))
+
+
+class CapacityAndDuplicatesTest(unittest.TestCase):
+    def test_capacity_limit(self):
+        manager = make_manager(capacity=2)
+        self.assertEqual(submit(manager, ("a", 1), ("b", 1), ("c", 1)), 2)
+        self.assertTrue(manager.is_full())
+        self.assertFalse(manager.enqueue_job(1, "d", 1))
+
+    def test_duplicate_ids_rejected_on_both_paths(self):
+        manager = make_manager()
+        self.assertTrue(manager.enqueue_job(1, "a", 1))
+        self.assertFalse(manager.enqueue_job(1, "a", 2))
+        self.assertEqual(submit(manager, ("a", 3), ("b", 1), ("b", 1)), 1)
+        self.assertEqual(drain(manager), ["a", "b"])
+
+    def test_str_subclass_ids_are_accepted(self):
+        class Name(str):
+            pass
+        manager = make_manager()
+        self.assertTrue(manager.enqueue_job(Name("u"), Name("a"), 1))
+        self.assertTrue(manager.is_job_queued("a"))
+        self.assertEqual(drain(manager), ["a"])
+
+    def test_id_can_be_reused_after_it_leaves(self):
+        manager = make_manager()
+        submit(manager, ("a", 1))
+        drain(manager)
+        self.assertEqual(submit(manager, ("a", 1)), 1)
+
+
+class InvalidPriorityTest(unittest.TestCase):
+    def test_invalid_priority_is_rejected_without_claiming_the_id(self):
+        manager = make_manager()
+        for priority in (None, "1", True, float("nan")):
+            self.assertFalse(manager.enqueue_job(1, "bad", priority))
+        self.assertEqual(submit(manager, ("bad", None)), 0)
+        self.assertTrue(manager.is_empty())
+        self.assertTrue(manager.enqueue_job(1, "bad", 1))
+
+    def test_failed_push_keeps_later_staged_jobs(self):
+        manager = make_manager()
+        manager.enqueue_job(1, "bad", 1)
+        manager.enqueue_job(1, "good", 2)
+        manager._by_id["bad"].priority = None  # slips past validation, fails in the push
+        with self.assertRaises(TypeError):
+            manager.tick()
+        self.assertFalse(manager.is_job_queued("bad"))
+        self.assertEqual(drain(manager), ["good"])
+        self.assertTrue(manager.enqueue_job(1, "bad", 1))
+
+
+class ExpressLaneTest(unittest.TestCase):
+    def test_interactive_jobs_go_newest_first_when_overloaded(self):
+        manager = make_manager(lifo_threshold=1)
+        submit(manager, ("a", 1), ("b", 1), ("i1", 5, True), ("i2", 5, True))
+        self.assertEqual(drain(manager), ["i2", "i1", "a", "b"])
+
+    def test_interactive_jobs_use_priority_below_threshold(self):
+        manager = make_manager(lifo_threshold=10)
+        submit(manager, ("a", 1), ("i1", 5, True))
+        self.assertEqual(drain(manager), ["a", "i1"])
+
+
+class ExpiryTest(unittest.TestCase):
+    def test_job_expires_at_deadline(self):
+        manager = make_manager(expiry_time=3)
+        submit(manager, ("a", 1))
+        manager.tick()
+        manager.tick()
+        self.assertTrue(manager.is_job_queued("a"))
+        self.assertEqual(manager.time_until_next_expiry(), 1)
+        manager.tick()
+        self.assertFalse(manager.is_job_queued("a"))
+        self.assertEqual(manager.total_expired_jobs, 1)
+        self.assertIsNone(manager.time_until_next_expiry())
+
+    def test_report(self):
+        manager = make_manager(expiry_time=2)
+        self.assertEqual(manager.get_expired_jobs_report(), "No jobs have expired yet.")
+        submit(manager, ("a", 1))
+        manager.tick()
+        submit(manager, ("b", 1))
+        for _ in range(3):
+            manager.tick()
+        report = manager.get_expired_jobs_report()
+        self.assertIn("Total: 2", report)
+        self.assertIn(" 1. Job a (User 1)\n    Expired at: Time 2\n    Total wait: 2s\n", report)
+        self.assertIn(" 2. Job b (User 1)\n    Expired at: Time 3\n    Total wait: 2s\n", report)
+
+    def test_near_expiry(self):
+        manager = make_manager(expiry_time=10)
+        submit(manager, ("a", 1))
+        for _ in range(8):
+            manager.tick()
+        submit(manager, ("b", 1))
+        self.assertEqual([job.job_id for job in manager.get_jobs_near_expiry(0.8)], ["a"])
+
+    def test_printed_job_does_not_expire(self):
+        manager = make_manager(expiry_time=2)
+        submit(manager, ("a", 1))
+        manager.print_job("a")
+        manager.tick()
+        manager.tick()
+        self.assertEqual(manager.total_expired_jobs, 0)
+
+    def test_released_jobs_do_not_pile_up_in_expiry_tracking(self):
+        manager = make_manager(capacity=3, expiry_time=1000, verbose=False)
+        for i in range(500):
+            manager.enqueue_job(1, i, 1)
+            manager.print_job(i if i % 2 else None)
+        self.assertLessEqual(len(manager._expiry_queue), 2 * manager.capacity)
+
+    def test_expiry_time_is_read_only(self):
+        manager = make_manager(expiry_time=5)
+        with self.assertRaises(AttributeError):
+            manager.expiry_time = 1
+
+
+class OutputTest(unittest.TestCase):
+    def test_staged_job_shows_in_status(self):
+        manager = make_manager()
+        manager.enqueue_job(1, "x", 1)
+        manager.show_status()
+        self.assertIn("JobID: x, UserID: 1, Priority: 1, Waiting: 0s", manager.output.getvalue())
+
+    def test_staged_job_shows_in_snapshot(self):
+        manager = make_manager()
+        manager.enqueue_job(1, "x", 1)
+        manager.print_queue_snapshot()
+        self.assertIn("1. User: 1, Job: x, Priority: 1, Waiting: 0", manager.output.getvalue())
+
+    def test_snapshot_follows_tick_output_in_order(self):
+        manager = make_manager()
+        manager.enqueue_job(1, "x", 1)
+        manager.tick()
+        manager.print_job()
+        manager.print_queue_snapshot()
+        out = manager.output.getvalue()
+        self.assertLess(out.index("[Tick 1]"), out.index("PRINTING: Job x"))
+        self.assertLess(out.index("PRINTING: Job x"), out.index("[Snapshot at time 1]"))
+
+    def test_default_output_is_stdout_at_write_time(self):
+        manager = PrintQueueManager()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            manager.enqueue_job(1, "x", 1)
+            manager.show_status()
+        self.assertIn("JobID: x", out.getvalue())
+
+    def test_not_verbose_writes_nothing(self):
+        manager = make_manager(verbose=False)
+        manager.enqueue_job(1, "x", 1)
+        manager.tick()
+        manager.show_status()
+        self.assertEqual(manager.output.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()